@@ -1,8 +1,10 @@
 import pygame
 import sys
 import math
+import numpy as np
 import random
 from enum import Enum
+from functools import lru_cache
 
 # Initialize Pygame
 pygame.init()
@@ -22,6 +24,8 @@ POINT_COLOR = (255, 255, 100)
 TEXT_COLOR = (200, 200, 220)
 HIGHLIGHT_COLOR = (255, 255, 255)
 PARALLEL_COLOR = (150, 255, 150)
+GLOW_ALPHA = 90
+GLOW_COLOR = (*(c * GLOW_ALPHA // 255 for c in EUCLIDEAN_COLOR), GLOW_ALPHA)
 
 class GeometryMode(Enum):
     EUCLIDEAN = 1
@@ -30,11 +34,20 @@ class GeometryMode(Enum):
 
 class GeometryViz:
     def __init__(self):
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # GPU-backed scaled display; fall back to a plain window where no renderer is available
+        try:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.DOUBLEBUF)
         pygame.display.set_caption("Geometry: Euclidean & Affine Planes")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 18)
+        
+        # Rendered text surfaces, reused while the same strings keep appearing
+        self.render_text = lru_cache(maxsize=512)(self._render_text)
+        self.point_label = lru_cache(maxsize=512)(self._point_label)
         
         # Geometry state
         self.mode = GeometryMode.BOTH
@@ -42,15 +55,11 @@ class GeometryViz:
         self.animate = True
         self.time = 0
         
-        # Points (in mathematical coordinates)
-        self.points = {
-            'A': [-120, -80],
-            'B': [150, 120],
-            'C': [-80, 150],
-            'D': [120, -120]
-        }
+        # Points (in mathematical coordinates), one row per name
+        self.point_names = ('A', 'B', 'C', 'D')
+        self.reset_points()
         
-        # Dragging state
+        # Dragging state (index of the dragged point)
         self.dragging = None
         self.drag_offset = [0, 0]
         
@@ -61,6 +70,28 @@ class GeometryViz:
         # Parallel lines for affine demonstration
         self.parallel_lines = []
         self.generate_parallel_lines()
+        
+        # Translucent overlay for the line glow; kept fully transparent between uses
+        self._overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        
+        # Pre-rendered point sprites for every size draw_points uses
+        # (base size 8, and 12-16 while pulsing during a drag)
+        self._point_sprites = {size: self.render_point_sprite(size)
+                               for size in [8, *range(12, 17)]}
+        
+        # Grid line endpoints in screen coordinates (fixed for the window size)
+        self._vlines = [((WIDTH//2 + x, 0), (WIDTH//2 + x, HEIGHT))
+                        for x in range(-WIDTH//2, WIDTH//2, GRID_SIZE)]
+        self._hlines = [((0, HEIGHT//2 - y), (WIDTH, HEIGHT//2 - y))
+                        for y in range(-HEIGHT//2, HEIGHT//2, GRID_SIZE)]
+        
+        # Static background (grid + axes) rendered once, with and without grid
+        self._bg_surface = self.render_background(show_grid=True)
+        self._bg_surface_nogrid = self.render_background(show_grid=False)
+    
+    def reset_points(self):
+        """Place points A, B, C, D at their default positions"""
+        self.points = np.array([[-120, -80], [150, 120], [-80, 150], [120, -120]], dtype=np.float64)
     
     def generate_parallel_lines(self):
         """Generate parallel lines to demonstrate affine properties"""
@@ -68,70 +99,94 @@ class GeometryViz:
         for i in range(3):
             # Create parallel lines with same direction vector
             offset = i * 45 - 45
+            start, end = [-250, -150 + offset], [250, 150 + offset]
             self.parallel_lines.append({
-                'start': [-250, -150 + offset],
-                'end': [250, 150 + offset],
+                'start': start,
+                'end': end,
+                'start_screen': self.to_screen(*start),
+                'end_screen': self.to_screen(*end),
                 'offset': offset
             })
     
+    def _render_text(self, font, text, color):
+        """Render antialiased text; wrapped in an LRU cache by __init__"""
+        return font.render(text, True, color)
+    
+    def _point_label(self, name, coord_text):
+        """Render a point name with its coordinates 17px below on one surface"""
+        name_label = self.font.render(name, True, TEXT_COLOR)
+        coord_label = self.font.render(coord_text, True, TEXT_COLOR)
+        width = max(name_label.get_width(), coord_label.get_width())
+        label = pygame.Surface((width, 17 + coord_label.get_height()), pygame.SRCALPHA)
+        # Transparent text color, so antialiased edges keep their color when blended
+        label.fill((*TEXT_COLOR, 0))
+        label.blit(name_label, (0, 0))
+        label.blit(coord_label, (0, 17))
+        return label.convert_alpha()
+    
     def to_screen(self, x, y):
         """Convert mathematical coordinates to screen coordinates"""
         return int(WIDTH / 2 + x), int(HEIGHT / 2 - y)
     
+    def to_screen_points(self, points):
+        """Convert an (N, 2) array of mathematical coordinates to screen coordinates"""
+        return np.column_stack([WIDTH / 2 + points[:, 0], HEIGHT / 2 - points[:, 1]]).astype(int)
+    
     def to_math(self, screen_x, screen_y):
         """Convert screen coordinates to mathematical coordinates"""
         return screen_x - WIDTH // 2, HEIGHT // 2 - screen_y
     
-    def draw_elegant_grid(self):
+    def render_background(self, show_grid):
+        """Pre-render the static grid and axes onto a background surface"""
+        surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+        surface.fill(DARK_BG)
+        if show_grid:
+            self.draw_elegant_grid(surface)
+        self.draw_axes(surface)
+        return surface
+    
+    def draw_elegant_grid(self, surface):
         """Draw an elegant grid system"""
-        if not self.show_grid:
-            return
-            
         # Draw subtle grid lines
-        for x in range(-WIDTH//2, WIDTH//2, GRID_SIZE):
-            screen_x = WIDTH//2 + x
-            alpha = max(30, 60 - abs(x) // 10)
-            color = (*GRID_COLOR[:2], min(255, alpha))
-            pygame.draw.line(self.screen, GRID_COLOR, (screen_x, 0), (screen_x, HEIGHT), 1)
+        for start, end in self._vlines:
+            pygame.draw.line(surface, GRID_COLOR, start, end, 1)
         
-        for y in range(-HEIGHT//2, HEIGHT//2, GRID_SIZE):
-            screen_y = HEIGHT//2 - y
-            pygame.draw.line(self.screen, GRID_COLOR, (0, screen_y), (WIDTH, screen_y), 1)
+        for start, end in self._hlines:
+            pygame.draw.line(surface, GRID_COLOR, start, end, 1)
     
-    def draw_axes(self):
+    def draw_axes(self, surface):
         """Draw coordinate axes with elegant styling"""
         # Main axes
-        pygame.draw.line(self.screen, AXIS_COLOR, (0, HEIGHT//2), (WIDTH, HEIGHT//2), 2)
-        pygame.draw.line(self.screen, AXIS_COLOR, (WIDTH//2, 0), (WIDTH//2, HEIGHT), 2)
+        pygame.draw.line(surface, AXIS_COLOR, (0, HEIGHT//2), (WIDTH, HEIGHT//2), 2)
+        pygame.draw.line(surface, AXIS_COLOR, (WIDTH//2, 0), (WIDTH//2, HEIGHT), 2)
         
         # Axis arrows
         arrow_size = 10
         # X-axis arrow
-        pygame.draw.polygon(self.screen, AXIS_COLOR, [
+        pygame.draw.polygon(surface, AXIS_COLOR, [
             (WIDTH - 15, HEIGHT//2),
             (WIDTH - 15 - arrow_size, HEIGHT//2 - 5),
             (WIDTH - 15 - arrow_size, HEIGHT//2 + 5)
         ])
         # Y-axis arrow
-        pygame.draw.polygon(self.screen, AXIS_COLOR, [
+        pygame.draw.polygon(surface, AXIS_COLOR, [
             (WIDTH//2, 15),
             (WIDTH//2 - 5, 15 + arrow_size),
             (WIDTH//2 + 5, 15 + arrow_size)
         ])
         
         # Axis labels
-        x_label = self.font.render("x", True, TEXT_COLOR)
-        y_label = self.font.render("y", True, TEXT_COLOR)
-        self.screen.blit(x_label, (WIDTH - 30, HEIGHT//2 + 10))
-        self.screen.blit(y_label, (WIDTH//2 + 10, 20))
+        x_label = self.render_text(self.font, "x", TEXT_COLOR)
+        y_label = self.render_text(self.font, "y", TEXT_COLOR)
+        surface.blit(x_label, (WIDTH - 30, HEIGHT//2 + 10))
+        surface.blit(y_label, (WIDTH//2 + 10, 20))
     
     def draw_euclidean_elements(self):
         """Draw Euclidean geometry elements with elegant effects"""
         if self.mode == GeometryMode.AFFINE:
             return
             
-        A, B = self.points['A'], self.points['B']
-        C, D = self.points['C'], self.points['D']
+        A, B = self.points[0], self.points[1]
         
         # Animated line thickness
         base_thickness = 3
@@ -139,30 +194,36 @@ class GeometryViz:
         thickness = int(base_thickness * pulse)
         
         # Draw main line AB with glow effect
-        for i in range(5, 0, -1):
-            alpha = (6 - i) * 30
-            color = (*EUCLIDEAN_COLOR, min(255, alpha))
-            pygame.draw.line(self.screen, EUCLIDEAN_COLOR, 
-                           self.to_screen(*A), self.to_screen(*B), thickness + i)
+        start, end = map(tuple, self.to_screen_points(self.points[:2]).tolist())
+        glow_width = thickness + 5
+        glow_rect = pygame.Rect(min(start[0], end[0]), min(start[1], end[1]),
+                                abs(end[0] - start[0]) + 1, abs(end[1] - start[1]) + 1)
+        glow_rect = glow_rect.inflate(2 * glow_width, 2 * glow_width).clip(self._overlay.get_rect())
+        
+        # One wide translucent glow line (premultiplied color), added to the
+        # screen in a single blit under the core line. Redrawing the same line
+        # transparent afterwards clears the overlay far cheaper than a fill.
+        pygame.draw.line(self._overlay, GLOW_COLOR, start, end, glow_width)
+        self.screen.blit(self._overlay, glow_rect.topleft, glow_rect,
+                         special_flags=pygame.BLEND_RGBA_ADD)
+        pygame.draw.line(self._overlay, (0, 0, 0, 0), start, end, glow_width)
+        pygame.draw.line(self.screen, EUCLIDEAN_COLOR, start, end, thickness)
         
         # Draw perpendicular line through midpoint (Euclidean property)
-        mid_x = (A[0] + B[0]) / 2
-        mid_y = (A[1] + B[1]) / 2
+        mid = (A + B) * 0.5
         
-        # Calculate perpendicular direction
-        dx, dy = B[0] - A[0], B[1] - A[1]
-        length = math.sqrt(dx*dx + dy*dy)
-        if length > 0:
-            perp_dx, perp_dy = -dy/length * 80, dx/length * 80
-            perp_start = [mid_x + perp_dx, mid_y + perp_dy]
-            perp_end = [mid_x - perp_dx, mid_y - perp_dy]
+        # Calculate perpendicular direction, scaled to length 80
+        dx, dy = (B - A).tolist()
+        distance = math.hypot(dx, dy)
+        if distance > 0:
+            scale = 80.0 / distance
+            perp = np.array([-dy * scale, dx * scale])
+            perp_start, perp_end = self.to_screen_points(np.stack([mid + perp, mid - perp])).tolist()
             
-            pygame.draw.line(self.screen, EUCLIDEAN_COLOR, 
-                           self.to_screen(*perp_start), self.to_screen(*perp_end), 2)
+            pygame.draw.line(self.screen, EUCLIDEAN_COLOR, perp_start, perp_end, 2)
         
         # Draw distance measurement (Euclidean concept)
-        distance = math.sqrt((B[0] - A[0])**2 + (B[1] - A[1])**2)
-        dist_text = self.font.render(f"d(A,B) = {distance:.1f}", True, EUCLIDEAN_COLOR)
+        dist_text = self.render_text(self.font, f"d(A,B) = {distance:.1f}", EUCLIDEAN_COLOR)
         self.screen.blit(dist_text, (50, 50))
     
     def draw_affine_elements(self):
@@ -171,80 +232,74 @@ class GeometryViz:
             return
             
         # Draw parallel lines (key affine property)
-        for i, line in enumerate(self.parallel_lines):
-            alpha = 150 + int(50 * math.sin(self.time + i))
-            color = (*PARALLEL_COLOR, min(255, alpha))
-            
-            start_screen = self.to_screen(*line['start'])
-            end_screen = self.to_screen(*line['end'])
-            pygame.draw.line(self.screen, PARALLEL_COLOR, start_screen, end_screen, 2)
+        for line in self.parallel_lines:
+            pygame.draw.aaline(self.screen, PARALLEL_COLOR, line['start_screen'], line['end_screen'])
         
         # Draw affine transformation demonstration
-        A, B, C = self.points['A'], self.points['B'], self.points['C']
+        triangle = self.points[:3]  # A, B, C
         
         # Original triangle
-        triangle_points = [self.to_screen(*A), self.to_screen(*B), self.to_screen(*C)]
+        triangle_points = self.to_screen_points(triangle).tolist()
         pygame.draw.polygon(self.screen, AFFINE_COLOR, triangle_points, 2)
         
-        # Transformed triangle (shear transformation)
+        # Transformed triangle (shear transformation: x' = x + s*y, y' = y)
         shear_factor = 0.3 * math.sin(self.time * 0.5)
-        transformed = []
-        for point in [A, B, C]:
-            tx = point[0] + shear_factor * point[1]
-            ty = point[1]
-            transformed.append(self.to_screen(tx, ty))
+        shear = np.array([[1, 0], [shear_factor, 1]])
+        transformed = self.to_screen_points(triangle @ shear).tolist()
         
         pygame.draw.polygon(self.screen, AFFINE_COLOR, transformed, 2)
         
         # Show affine properties text
-        affine_text = self.font.render("Affine Properties: Parallel lines remain parallel", True, AFFINE_COLOR)
+        affine_text = self.render_text(self.font, "Affine Properties: Parallel lines remain parallel", AFFINE_COLOR)
         self.screen.blit(affine_text, (30, HEIGHT - 80))
         
-        ratio_text = self.font.render("Ratios of parallel segments preserved", True, AFFINE_COLOR)
+        ratio_text = self.render_text(self.font, "Ratios of parallel segments preserved", AFFINE_COLOR)
         self.screen.blit(ratio_text, (30, HEIGHT - 55))
     
+    def render_point_sprite(self, size):
+        """Render a point of the given size with a translucent radial glow"""
+        radius = size + 3
+        sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        for i in range(3, 0, -1):
+            alpha = (4 - i) * 60
+            pygame.draw.circle(sprite, (*POINT_COLOR, alpha), (radius, radius), size + i)
+        pygame.draw.circle(sprite, POINT_COLOR, (radius, radius), size)
+        return sprite.convert_alpha()
+    
     def draw_points(self):
         """Draw interactive points with elegant styling"""
-        for name, pos in self.points.items():
-            screen_pos = self.to_screen(*pos)
-            
+        screen_points = self.to_screen_points(self.points).tolist()
+        for i, (name, pos, screen_pos) in enumerate(zip(self.point_names, self.points, screen_points)):
             # Animated point size
             base_size = 8
-            if self.dragging == name:
+            if self.dragging == i:
                 pulse = math.sin(self.pulse_phase * 2) * 2 + 6
                 size = int(base_size + pulse)
             else:
                 size = base_size
             
             # Draw point with glow
-            for i in range(3, 0, -1):
-                alpha = (4 - i) * 60
-                pygame.draw.circle(self.screen, POINT_COLOR, screen_pos, size + i)
-            
-            # Point label
-            label = self.font.render(name, True, TEXT_COLOR)
-            label_pos = (screen_pos[0] + 12, screen_pos[1] - 12)
-            self.screen.blit(label, label_pos)
+            sprite = self._point_sprites[size]
+            radius = size + 3
+            self.screen.blit(sprite, (screen_pos[0] - radius, screen_pos[1] - radius))
             
-            # Show coordinates
+            # Point label with coordinates underneath
             coord_text = f"({pos[0]:.0f}, {pos[1]:.0f})"
-            coord_label = self.font.render(coord_text, True, TEXT_COLOR)
-            coord_pos = (screen_pos[0] + 12, screen_pos[1] + 5)
-            self.screen.blit(coord_label, coord_pos)
+            label = self.point_label(name, coord_text)
+            self.screen.blit(label, (screen_pos[0] + 12, screen_pos[1] - 12))
     
     def draw_ui(self):
         """Draw elegant UI elements"""
         # Title
-        title = self.title_font.render("Euclidean & Affine Planes", True, HIGHLIGHT_COLOR)
+        title = self.render_text(self.title_font, "Euclidean & Affine Planes", HIGHLIGHT_COLOR)
         self.screen.blit(title, (20, 20))
         
         # Mode indicator
         mode_text = f"Mode: {self.mode.name}"
-        mode_label = self.font.render(mode_text, True, TEXT_COLOR)
+        mode_label = self.render_text(self.font, mode_text, TEXT_COLOR)
         self.screen.blit(mode_label, (20, 70))
         
         # Instructions (smaller font and repositioned)
-        small_font = pygame.font.Font(None, 18)
         instructions = [
             "Keys: E=Euclidean, A=Affine, B=Both",
             "G=Grid, Space=Animate, R=Reset",
@@ -252,48 +307,47 @@ class GeometryViz:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = small_font.render(instruction, True, TEXT_COLOR)
+            text = self.render_text(self.small_font, instruction, TEXT_COLOR)
             self.screen.blit(text, (WIDTH - 280, 30 + i * 20))
     
     def handle_mouse(self, mouse_pos, mouse_pressed):
         """Handle mouse interactions"""
         if mouse_pressed[0]:  # Left mouse button
             if self.dragging is None:
-                # Check if clicking on a point
-                for name, pos in self.points.items():
-                    screen_pos = self.to_screen(*pos)
-                    distance = math.sqrt((mouse_pos[0] - screen_pos[0])**2 + 
-                                       (mouse_pos[1] - screen_pos[1])**2)
-                    if distance < 15:
-                        self.dragging = name
-                        self.drag_offset = [mouse_pos[0] - screen_pos[0], 
-                                          mouse_pos[1] - screen_pos[1]]
-                        break
+                # Check if clicking on a point: nearest one within 15px, compared squared
+                offsets = np.array(mouse_pos) - self.to_screen_points(self.points)
+                dist_sq = (offsets**2).sum(axis=1)
+                nearest = int(dist_sq.argmin())
+                if dist_sq[nearest] < 15*15:
+                    self.dragging = nearest
+                    self.drag_offset = offsets[nearest].tolist()
             else:
                 # Update dragged point position
                 new_pos = self.to_math(mouse_pos[0] - self.drag_offset[0], 
                                      mouse_pos[1] - self.drag_offset[1])
-                self.points[self.dragging] = list(new_pos)
+                self.points[self.dragging] = new_pos
         else:
             self.dragging = None
     
     def run(self):
         """Main game loop"""
         running = True
+        dirty = True  # Redraw needed; stays set only while animating
         
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
-            self.time += dt
-            
-            if self.animate:
-                self.pulse_phase += dt * 3
-                self.rotation_angle += dt * 0.5
+            # Full rate while anything moves, reduced rate while static
+            active = self.animate or self.dragging is not None
+            dt = self.clock.tick(FPS if active else 30) / 1000.0
             
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                    pygame.WINDOWEXPOSED):
+                    dirty = True
                 elif event.type == pygame.KEYDOWN:
+                    dirty = True
                     if event.key == pygame.K_e:
                         self.mode = GeometryMode.EUCLIDEAN
                     elif event.key == pygame.K_a:
@@ -306,28 +360,33 @@ class GeometryViz:
                         self.animate = not self.animate
                     elif event.key == pygame.K_r:
                         # Reset points to default positions
-                        self.points = {
-                            'A': [-120, -80],
-                            'B': [150, 120],
-                            'C': [-80, 150],
-                            'D': [120, -120]
-                        }
+                        self.reset_points()
             
             # Handle mouse
             mouse_pos = pygame.mouse.get_pos()
             mouse_pressed = pygame.mouse.get_pressed()
             self.handle_mouse(mouse_pos, mouse_pressed)
+            if self.dragging is not None:
+                dirty = True
             
-            # Draw everything
-            self.screen.fill(DARK_BG)
-            self.draw_elegant_grid()
-            self.draw_axes()
-            self.draw_euclidean_elements()
-            self.draw_affine_elements()
-            self.draw_points()
-            self.draw_ui()
-            
-            pygame.display.flip()
+            # Draw everything, but only when something changed
+            if dirty:
+                # Advance animation only on drawn frames, and only while animating,
+                # so Space freezes all motion even while a drag keeps redrawing
+                if self.animate:
+                    self.time += dt
+                    self.pulse_phase += dt * 3
+                    self.rotation_angle += dt * 0.5
+                
+                background = self._bg_surface if self.show_grid else self._bg_surface_nogrid
+                self.screen.blit(background, (0, 0))
+                self.draw_euclidean_elements()
+                self.draw_affine_elements()
+                self.draw_points()
+                self.draw_ui()
+                
+                pygame.display.flip()
+                dirty = self.animate
         
         pygame.quit()
         sys.exit()
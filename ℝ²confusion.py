@@ -8,6 +8,14 @@ import sys
 import math
 import numpy as np
 from enum import Enum
+from functools import lru_cache
+from itertools import product
+
+# Numba is optional: it only speeds up the complex solution generation
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Initialize Pygame
 pygame.init()
@@ -29,6 +37,41 @@ TEXT_COLOR = (200, 200, 220)
 HIGHLIGHT_COLOR = (255, 255, 255)
 DIM_COLOR = (100, 100, 120)
 
+def _complex_circle_solutions_numpy(r):
+    """Vectorized solutions to z₁² + z₂² = r², used when Numba is unavailable"""
+    # Parametric: z₁ = r*cos(t), z₂ = r*sin(t) where t can be complex
+    t_real = np.linspace(0, 2*math.pi, 40)[:, None]
+    t_imag = np.linspace(-0.5, 0.5, 5)[None, :]  # Small imaginary part
+    
+    # z₁ = r * cos(t), z₂ = r * sin(t)
+    z1 = r * (np.cos(t_real) * np.cosh(t_imag) - 1j * np.sin(t_real) * np.sinh(t_imag))
+    z2 = r * (np.sin(t_real) * np.cosh(t_imag) + 1j * np.cos(t_real) * np.sinh(t_imag))
+    
+    return np.stack([z1.ravel(), z2.ravel()], axis=1)
+
+def _complex_circle_solutions_loop(r):
+    """Solutions to z₁² + z₂² = r² in one fused loop, compiled by Numba"""
+    t_real = np.linspace(0, 2*math.pi, 40)
+    t_imag = np.linspace(-0.5, 0.5, 5)  # Small imaginary part
+    solutions = np.empty((t_real.size * t_imag.size, 2), dtype=np.complex128)
+    
+    k = 0
+    for tr in t_real:
+        cos_r, sin_r = math.cos(tr), math.sin(tr)
+        for ti in t_imag:
+            cosh_i, sinh_i = math.cosh(ti), math.sinh(ti)
+            solutions[k, 0] = complex(r * cos_r * cosh_i, -r * sin_r * sinh_i)
+            solutions[k, 1] = complex(r * sin_r * cosh_i, r * cos_r * sinh_i)
+            k += 1
+    
+    return solutions
+
+if njit is not None:
+    _solve_complex_circle = njit("complex128[:, ::1](float64)",
+                                 cache=True, fastmath=True)(_complex_circle_solutions_loop)
+else:
+    _solve_complex_circle = _complex_circle_solutions_numpy
+
 class ViewMode(Enum):
     REAL_PLANE = "Real Plane ℝ²"
     COMPLEX_PROJECTION = "ℂ² → ℝ² Projection"
@@ -37,7 +80,11 @@ class ViewMode(Enum):
 
 class CrossSectionViz:
     def __init__(self):
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # GPU-backed scaled display; fall back to a plain window where no renderer is available
+        try:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.DOUBLEBUF)
         pygame.display.set_caption("Cross-Sections of Higher-Dimensional Algebraic Spaces")
         self.clock = pygame.time.Clock()
         
@@ -53,6 +100,9 @@ class CrossSectionViz:
             self.math_font = pygame.font.SysFont('arial', 12)
             self.small_font = pygame.font.SysFont('arial', 10)
         
+        # Rendered text surfaces, reused while the same strings keep appearing
+        self.render_text = lru_cache(maxsize=512)(self._render_text)
+        
         # State
         self.view_mode = ViewMode.REAL_PLANE
         self.time = 0
@@ -68,31 +118,56 @@ class CrossSectionViz:
         # Curve equation: z₁² + z₂² = r² over ℂ
         self.radius = 80
         
+        # Sample abscissae for the hyperbolic cross-sections
+        self._slice_xs = np.linspace(-50, 50, 100)
+        
+        # Point sets for the multi-field view (depend only on the radius)
+        target = (self.radius // 10) % 11  # Simulate finite field arithmetic
+        self._f11_points = [(x*15, y*15) for x, y in product(range(-2, 3), repeat=2)
+                            if (x*x + y*y) % 11 == target]
+        # Use rational approximations to show discrete nature
+        self._qbar_points = [(int(40 * math.cos(angle)), int(40 * math.sin(angle)))
+                             for angle in np.linspace(0, 2*math.pi, 20)]
+        
+    def _render_text(self, font, text, color):
+        """Render antialiased text; wrapped in an LRU cache by __init__"""
+        return font.render(text, True, color)
+    
     def to_screen(self, x, y, offset_x=0, offset_y=0):
         """Convert coordinates to screen with optional offset"""
         base_x = WIDTH // 2 + offset_x
         base_y = HEIGHT // 2 + offset_y
         return int(base_x + x), int(base_y - y)
     
-    def complex_circle_solutions(self, r):
-        """Generate solutions to z₁² + z₂² = r² over ℂ"""
-        solutions = []
-        
-        # Parametric: z₁ = r*cos(t), z₂ = r*sin(t) where t can be complex
-        for real_t in np.linspace(0, 2*math.pi, 40):
-            for complex_param in np.linspace(-0.5, 0.5, 5):  # Small imaginary part
-                t = complex(real_t, complex_param)
-                
-                # z₁ = r * cos(t), z₂ = r * sin(t)
-                z1 = r * complex(math.cos(t.real) * math.cosh(t.imag), 
-                                -math.sin(t.real) * math.sinh(t.imag))
-                z2 = r * complex(math.sin(t.real) * math.cosh(t.imag), 
-                                math.cos(t.real) * math.sinh(t.imag))
-                
-                solutions.append((z1, z2))
-        
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def complex_circle_solutions(r):
+        """Generate solutions to z₁² + z₂² = r² over ℂ as an (N, 2) array of (z₁, z₂)"""
+        solutions = _solve_complex_circle(float(r))
+        solutions.flags.writeable = False  # Shared between calls by the cache
         return solutions
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def circle_stencil(radius):
+        """Pixel offsets covered by pygame.draw.circle of the given radius"""
+        size = 2 * radius + 3
+        scratch = pygame.Surface((size, size))
+        pygame.draw.circle(scratch, (255, 255, 255), (radius + 1, radius + 1), radius)
+        dx, dy = np.nonzero(pygame.surfarray.array2d(scratch))
+        return dx - (radius + 1), dy - (radius + 1)
+    
+    def splat_points(self, xs, ys, color, radius):
+        """Draw small filled circles at integer screen coordinates in one array write"""
+        dx, dy = self.circle_stencil(radius)
+        px = (xs[:, None] + dx).ravel()
+        py = (ys[:, None] + dy).ravel()
+        visible = (px >= 0) & (px < WIDTH) & (py >= 0) & (py < HEIGHT)
+        
+        pixels = pygame.surfarray.pixels3d(self.screen)
+        pixels[px[visible], py[visible]] = color
+        del pixels  # Release the surface lock
+    
     def draw_coordinate_system(self, offset_x=0, offset_y=0, label=""):
         """Draw coordinate system with given offset"""
         center_x = WIDTH // 2 + offset_x
@@ -115,7 +190,7 @@ class CrossSectionViz:
         
         # Label
         if label:
-            label_surface = self.font.render(label, True, HIGHLIGHT_COLOR)
+            label_surface = self.render_text(self.font, label, HIGHLIGHT_COLOR)
             self.screen.blit(label_surface, (center_x - 100, center_y - 180))
     
     def draw_real_plane_view(self):
@@ -138,7 +213,7 @@ class CrossSectionViz:
         
         for i, text in enumerate(annotations):
             color = HIGHLIGHT_COLOR if i == 0 else TEXT_COLOR
-            surface = self.math_font.render(text, True, color)
+            surface = self.render_text(self.math_font, text, color)
             self.screen.blit(surface, (50, 100 + i * 18))
     
     def draw_complex_projection_view(self):
@@ -153,20 +228,24 @@ class CrossSectionViz:
         solutions = self.complex_circle_solutions(self.radius)
         
         # Draw the projection process
-        for i, (z1, z2) in enumerate(solutions[::3]):  # Subsample for clarity
-            # Full complex point (show real parts)
-            real_pt = self.to_screen(z1.real, z2.real, -200, 0)
-            
-            # Projected point (same as real part)
-            proj_pt = self.to_screen(z1.real, z2.real, 200, 0)
-            
-            # Draw points
-            pygame.draw.circle(self.screen, COMPLEX_HIDDEN_COLOR, real_pt, 2)
-            pygame.draw.circle(self.screen, REAL_SECTION_COLOR, proj_pt, 2)
-            
-            # Draw projection line
-            if self.show_projections and i % 5 == 0:
-                pygame.draw.line(self.screen, PROJECTION_COLOR, real_pt, proj_pt, 1)
+        sampled = solutions[::3]  # Subsample for clarity
+        xs, ys = sampled[:, 0].real, sampled[:, 1].real
+        
+        # Full complex point (show real parts) and projected point (same as real part)
+        real_x = (WIDTH // 2 - 200 + xs).astype(int)
+        proj_x = (WIDTH // 2 + 200 + xs).astype(int)
+        sy = (HEIGHT // 2 - ys).astype(int)
+        
+        # Draw points
+        self.splat_points(real_x, sy, COMPLEX_HIDDEN_COLOR, 2)
+        self.splat_points(proj_x, sy, REAL_SECTION_COLOR, 2)
+        
+        # Draw projection lines
+        if self.show_projections:
+            self.screen.lock()
+            for rx, px, y in zip(real_x[::5].tolist(), proj_x[::5].tolist(), sy[::5].tolist()):
+                pygame.draw.line(self.screen, PROJECTION_COLOR, (rx, y), (px, y), 1)
+            self.screen.unlock()
         
         # Show what's hidden
         hidden_info = [
@@ -181,9 +260,22 @@ class CrossSectionViz:
         
         for i, text in enumerate(hidden_info):
             color = HIGHLIGHT_COLOR if "ℂ²" in text else TEXT_COLOR
-            surface = self.math_font.render(text, True, color)
+            surface = self.render_text(self.math_font, text, color)
             self.screen.blit(surface, (50, HEIGHT - 200 + i * 16))
     
+    def draw_hyperbolic_section(self, slice_value, offset_x, offset_y):
+        """Draw the section traced by one coordinate when the other is fixed"""
+        # From z₁² + z₂² = r², if z₂ is fixed, z₁ traces hyperbola
+        xs = self._slice_xs
+        # abs() keeps the radicand non-negative, so no mask or error handling is needed
+        ys = np.sqrt(np.abs(self.radius**2 - slice_value**2 - xs*xs))
+        
+        sx = (WIDTH // 2 + offset_x + xs).astype(int)
+        base_y = HEIGHT // 2 + offset_y
+        self.splat_points(np.concatenate([sx, sx]),
+                          np.concatenate([(base_y - ys).astype(int), (base_y + ys).astype(int)]),
+                          COMPLEX_HIDDEN_COLOR, 1)
+    
     def draw_four_d_slices(self):
         """Show different slices through ℝ⁴"""
         # Four quadrants showing different 2D slices of ℝ⁴
@@ -205,27 +297,10 @@ class CrossSectionViz:
             
             elif i == 1:  # Re(z₁) × Im(z₁) slice
                 # This shows hyperbolic sections for complex solutions
-                for x in np.linspace(-50, 50, 100):
-                    # From z₁² + z₂² = r², if z₂ is fixed, z₁ traces hyperbola
-                    try:
-                        y_val = math.sqrt(abs(self.radius**2 - self.slice_imaginary**2 - x**2))
-                        pt1 = self.to_screen(x, y_val, offset_x, offset_y)
-                        pt2 = self.to_screen(x, -y_val, offset_x, offset_y)
-                        pygame.draw.circle(self.screen, COMPLEX_HIDDEN_COLOR, pt1, 1)
-                        pygame.draw.circle(self.screen, COMPLEX_HIDDEN_COLOR, pt2, 1)
-                    except:
-                        pass
+                self.draw_hyperbolic_section(self.slice_imaginary, offset_x, offset_y)
             
             elif i == 2:  # Re(z₂) × Im(z₂) slice  
-                for x in np.linspace(-50, 50, 100):
-                    try:
-                        y_val = math.sqrt(abs(self.radius**2 - self.slice_real_im**2 - x**2))
-                        pt1 = self.to_screen(x, y_val, offset_x, offset_y)
-                        pt2 = self.to_screen(x, -y_val, offset_x, offset_y)
-                        pygame.draw.circle(self.screen, COMPLEX_HIDDEN_COLOR, pt1, 1)
-                        pygame.draw.circle(self.screen, COMPLEX_HIDDEN_COLOR, pt2, 1)
-                    except:
-                        pass
+                self.draw_hyperbolic_section(self.slice_real_im, offset_x, offset_y)
             
             elif i == 3:  # Im(z₁) × Im(z₂) slice
                 # Pure imaginary slice
@@ -248,7 +323,7 @@ class CrossSectionViz:
         
         for i, text in enumerate(slice_info):
             color = HIGHLIGHT_COLOR if "4D" in text else TEXT_COLOR
-            surface = self.math_font.render(text, True, color)
+            surface = self.render_text(self.math_font, text, color)
             self.screen.blit(surface, (50, 50 + i * 16))
     
     def draw_multi_field_comparison(self):
@@ -273,19 +348,14 @@ class CrossSectionViz:
             
             elif field == "𝔽₁₁":
                 # Finite field - discrete points
-                for x in range(-2, 3):
-                    for y in range(-2, 3):
-                        if (x*x + y*y) % 11 == (self.radius//10) % 11:  # Simulate finite field arithmetic
-                            pt = self.to_screen(x*15, y*15, offset_x, offset_y)
-                            pygame.draw.circle(self.screen, (200, 100, 255), pt, 3)
+                for x, y in self._f11_points:
+                    pt = self.to_screen(x, y, offset_x, offset_y)
+                    pygame.draw.circle(self.screen, (200, 100, 255), pt, 3)
             
             elif field == "ℚ̄":
                 # Algebraic closure of rationals - very abstract
                 # Show some rational approximations
-                for angle in np.linspace(0, 2*math.pi, 20):
-                    # Use rational approximations to show discrete nature
-                    x = int(40 * math.cos(angle))
-                    y = int(40 * math.sin(angle))
+                for x, y in self._qbar_points:
                     pt = self.to_screen(x, y, offset_x, offset_y)
                     pygame.draw.circle(self.screen, (255, 200, 100), pt, 2)
         
@@ -304,14 +374,14 @@ class CrossSectionViz:
         
         for i, text in enumerate(comparison_info):
             color = HIGHLIGHT_COLOR if text.startswith("Same equation") else TEXT_COLOR
-            surface = self.math_font.render(text, True, color)
+            surface = self.render_text(self.math_font, text, color)
             self.screen.blit(surface, (50, 50 + i * 16))
     
     def draw_ui(self):
         """Draw user interface"""
         # Title
         title = f"Cross-Sections & Projections: {self.view_mode.value}"
-        title_surface = self.title_font.render(title, True, HIGHLIGHT_COLOR)
+        title_surface = self.render_text(self.title_font, title, HIGHLIGHT_COLOR)
         self.screen.blit(title_surface, (20, 20))
         
         # Controls
@@ -321,26 +391,26 @@ class CrossSectionViz:
         ]
         
         for i, control in enumerate(controls):
-            surface = self.small_font.render(control, True, TEXT_COLOR)
+            surface = self.render_text(self.small_font, control, TEXT_COLOR)
             self.screen.blit(surface, (20, HEIGHT - 40 + i * 15))
     
     def run(self):
         """Main loop"""
         running = True
+        dirty = True  # Redraw needed; stays set only while animating
         
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
-            self.time += dt
-            
-            if self.animate:
-                self.slice_real_im = 0.3 * math.sin(self.time * 0.5)
-                self.slice_imaginary = 0.3 * math.cos(self.time * 0.7)
+            # Full rate while animating, reduced rate while static
+            dt = self.clock.tick(FPS if self.animate else 30) / 1000.0
             
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.WINDOWEXPOSED:
+                    dirty = True
                 elif event.type == pygame.KEYDOWN:
+                    dirty = True
                     if event.key == pygame.K_1:
                         self.view_mode = ViewMode.REAL_PLANE
                     elif event.key == pygame.K_2:
@@ -364,20 +434,28 @@ class CrossSectionViz:
                     elif event.key == pygame.K_a:
                         self.animate = not self.animate
             
-            # Draw
-            self.screen.fill(DARK_BG)
-            
-            if self.view_mode == ViewMode.REAL_PLANE:
-                self.draw_real_plane_view()
-            elif self.view_mode == ViewMode.COMPLEX_PROJECTION:
-                self.draw_complex_projection_view()
-            elif self.view_mode == ViewMode.FOUR_D_SLICES:
-                self.draw_four_d_slices()
-            elif self.view_mode == ViewMode.MULTI_FIELD:
-                self.draw_multi_field_comparison()
-            
-            self.draw_ui()
-            pygame.display.flip()
+            # Draw, but only when something changed
+            if dirty:
+                # Advance animation only on drawn frames, and only while animating
+                if self.animate:
+                    self.time += dt
+                    self.slice_real_im = 0.3 * math.sin(self.time * 0.5)
+                    self.slice_imaginary = 0.3 * math.cos(self.time * 0.7)
+                
+                self.screen.fill(DARK_BG)
+                
+                if self.view_mode == ViewMode.REAL_PLANE:
+                    self.draw_real_plane_view()
+                elif self.view_mode == ViewMode.COMPLEX_PROJECTION:
+                    self.draw_complex_projection_view()
+                elif self.view_mode == ViewMode.FOUR_D_SLICES:
+                    self.draw_four_d_slices()
+                elif self.view_mode == ViewMode.MULTI_FIELD:
+                    self.draw_multi_field_comparison()
+                
+                self.draw_ui()
+                pygame.display.flip()
+                dirty = self.animate
         
         pygame.quit()
         sys.exit()